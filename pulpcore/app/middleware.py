@@ -0,0 +1,15 @@
+from django.middleware.gzip import GZipMiddleware
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """
+    Compress API responses with gzip, except HTML pages.
+
+    HTML pages such as the browsable API embed the CSRF token, and compressing them makes the token
+    vulnerable to the BREACH attack. Other responses (e.g. JSON) are compressed as usual.
+    """
+
+    def process_response(self, request, response):
+        if response.get("Content-Type", "").startswith("text/html"):
+            return response
+        return super().process_response(request, response)
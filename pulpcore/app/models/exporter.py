@@ -86,14 +86,15 @@ class FilesystemExporter(Exporter):
         if content_artifacts.filter(artifact=None).exists():
             RuntimeError(_("Remote artifacts cannot be exported."))
 
+        created_dirs = set()
         for ca in content_artifacts:
             artifact = ca.artifact
             dest = os.path.join(self.path, ca.relative_path)
 
-            try:
-                os.makedirs(os.path.split(dest)[0])
-            except FileExistsError:
-                pass
+            dest_dir = os.path.split(dest)[0]
+            if dest_dir not in created_dirs:
+                os.makedirs(dest_dir, exist_ok=True)
+                created_dirs.add(dest_dir)
 
             if settings.DEFAULT_FILE_STORAGE == "pulpcore.app.models.storage.FileSystem":
                 src = os.path.join(settings.MEDIA_ROOT, artifact.file.name)
@@ -507,20 +507,16 @@ class RepositoryVersionQuerySet(models.QuerySet):
         Returns:
             django.db.models.QuerySet: Repository versions which contains content.
         """
-        query = models.Q(pk__in=[])
-        repo_content = RepositoryContent.objects.filter(content__pk__in=content)
-
-        for rc in repo_content.iterator():
-            filter = models.Q(
-                repository__pk=rc.repository.pk,
-                number__gte=rc.version_added.number,
-            )
-            if rc.version_removed:
-                filter &= models.Q(number__lt=rc.version_removed.number)
-
-            query |= filter
+        repo_content = RepositoryContent.objects.filter(
+            content__pk__in=content,
+            repository=models.OuterRef("repository"),
+            version_added__number__lte=models.OuterRef("number"),
+        ).filter(
+            models.Q(version_removed=None)
+            | models.Q(version_removed__number__gt=models.OuterRef("number"))
+        )
 
-        return self.filter(query)
+        return self.filter(models.Exists(repo_content))
 
 
 class RepositoryVersion(BaseModel):
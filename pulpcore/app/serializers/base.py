@@ -1,3 +1,5 @@
+from collections import OrderedDict
+import copy
 from gettext import gettext as _
 from logging import getLogger
 import re
@@ -36,6 +38,47 @@ def validate_unknown_fields(initial_data, defined_fields):
         raise serializers.ValidationError(unknown_fields)
 
 
+def _copy_fields(fields):
+    """
+    Copy a mapping of unbound serializer fields for use by a new serializer instance.
+
+    Simple fields are shallow copied, along with any list, dict or set attribute (e.g.
+    ``validators``, ``error_messages``), so that a serializer changing its fields in place does not
+    affect other instances or the serializer class. Fields that wrap other fields (nested
+    serializers, ``child`` of a ListField or DictField, ``child_relation`` of a many=True relation)
+    are deep copied so that their children are bound to the new serializer instance as well.
+    """
+    copied_fields = OrderedDict()
+    for name, field in fields.items():
+        if (
+            isinstance(field, serializers.BaseSerializer)
+            or hasattr(field, "child")
+            or hasattr(field, "child_relation")
+        ):
+            copied_fields[name] = copy.deepcopy(field)
+        else:
+            copied_field = copy.copy(field)
+            copied_attrs = vars(copied_field)
+            for attr, value in copied_attrs.items():
+                if isinstance(value, (list, dict, set)):
+                    copied_attrs[attr] = copy.copy(value)
+            copied_fields[name] = copied_field
+    return copied_fields
+
+
+class _DeclaredFields(OrderedDict):
+    """
+    The declared fields of a serializer class.
+
+    DRF calls ``copy.deepcopy()`` on the declared fields for every serializer instance, which
+    re-instantiates each field from its original arguments. This mapping copies them with
+    ``_copy_fields()`` instead.
+    """
+
+    def __deepcopy__(self, memo):
+        return _copy_fields(self)
+
+
 class ValidateFieldsMixin:
     """A mixin for validating unknown serializers' fields."""
 
@@ -63,6 +106,25 @@ class ModelSerializer(
     # default is 'fields!' which doesn't work in the bindings for some langs
     exclude_arg_name = "exclude_fields"
 
+    # the unbound fields of each serializer class, keyed by the class
+    _fields_cache = {}
+
+    # DRF hooks used to build the fields, which subclasses may make depend on the instance
+    _field_building_hooks = (
+        "get_field_names",
+        "get_default_field_names",
+        "get_extra_kwargs",
+        "get_uniqueness_extra_kwargs",
+        "include_extra_kwargs",
+        "build_field",
+        "build_standard_field",
+        "build_relational_field",
+        "build_nested_field",
+        "build_property_field",
+        "build_url_field",
+        "build_unknown_field",
+    )
+
     class Meta:
         fields = ("pulp_href", "pulp_created")
 
@@ -102,6 +164,12 @@ class ModelSerializer(
     def __init_subclass__(cls, **kwargs):
         """Set default attributes in subclasses.
 
+        Wraps the declared fields in a ``_DeclaredFields`` mapping, so that serializer instances
+        do not deep copy every declared field.
+
+        Sets ``_cache_fields`` to whether the built fields can be cached for the class, which is
+        only the case if none of the DRF hooks used to build them is overridden.
+
         Sets the default for the ``ref_name`` attribute for a ModelSerializers's
         ``Meta`` class.
 
@@ -118,6 +186,11 @@ class ModelSerializer(
 
         """
         super().__init_subclass__(**kwargs)
+        cls._declared_fields = _DeclaredFields(cls._declared_fields)
+        cls._cache_fields = all(
+            getattr(cls, hook) is getattr(ModelSerializer, hook)
+            for hook in cls._field_building_hooks
+        )
         meta = cls.Meta
         try:
             if not hasattr(meta, "ref_name"):
@@ -127,6 +200,25 @@ class ModelSerializer(
         except AttributeError:
             pass
 
+    def get_fields(self):
+        """
+        Return a copy of the fields of this serializer class.
+
+        DRF builds the fields from the declared fields and the model on every instantiation. Unless
+        a subclass overrides one of the hooks used to build them, they only depend on the
+        serializer class, so they are built once per class and copied.
+
+        Returns:
+            OrderedDict: Unbound fields of this serializer keyed by field name
+        """
+        if not self._cache_fields:
+            return super().get_fields()
+        try:
+            fields = self._fields_cache[type(self)]
+        except KeyError:
+            fields = self._fields_cache[type(self)] = super().get_fields()
+        return _copy_fields(fields)
+
     def _update_labels(self, instance, labels):
         """
         Update the labels for a Model instance.
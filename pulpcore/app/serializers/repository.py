@@ -322,12 +322,20 @@ class RepositorySyncURLSerializer(ValidateFieldsMixin, serializers.Serializer):
     def validate(self, data):
         data = super().validate(data)
 
+        if "remote" in data:
+            return data
+
         try:
-            remote = models.Repository.objects.get(pk=self.context["repository_pk"]).remote
+            repository_pk = self.context["repository_pk"]
         except KeyError:
-            remote = None
-
-        if "remote" not in data and not remote:
+            has_remote = False
+        else:
+            # only check whether a remote is set, there is no need to load the repository or remote
+            has_remote = models.Repository.objects.filter(
+                pk=repository_pk, remote__isnull=False
+            ).exists()
+
+        if not has_remote:
             raise serializers.ValidationError(
                 {"remote": _("This field is required since a remote is not set on the repository.")}
             )
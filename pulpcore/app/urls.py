@@ -2,9 +2,8 @@
 import logging
 
 from django.conf import settings
-from django.conf.urls import include, url
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path, re_path
 from drf_spectacular.views import (
     SpectacularJSONAPIView,
     SpectacularYAMLAPIView,
@@ -120,64 +119,52 @@ for viewset in sorted_by_depth:
 #: The Pulp Platform v3 API router, which can be used to manually register ViewSets with the API.
 root_router = routers.DefaultRouter()
 
-urlpatterns = [
-    url(r"^{api_root}repair/".format(api_root=API_ROOT), RepairView.as_view()),
-    url(r"^{api_root}status/".format(api_root=API_ROOT), StatusView.as_view()),
-    url(
-        r"^{api_root}orphans/cleanup/".format(api_root=API_ROOT),
-        OrphansCleanupViewset.as_view({"post": "cleanup"}),
-    ),
-    url(r"^{api_root}orphans/".format(api_root=API_ROOT), OrphansView.as_view()),
-    url(
-        r"^{api_root}repository_versions/".format(api_root=API_ROOT),
-        ListRepositoryVersionViewSet.as_view({"get": "list"}),
-    ),
-    url(
-        r"^{api_root}importers/core/pulp/import-check/".format(api_root=API_ROOT),
-        PulpImporterImportCheckView.as_view(),
-    ),
-    url(r"^auth/", include("rest_framework.urls")),
-    path(settings.ADMIN_SITE_URL, admin.site.urls),
-]
-
-urlpatterns.append(
-    url(
-        r"^{api_root}docs/api.json".format(api_root=API_ROOT),
+# Every API route shares the API_ROOT prefix, so they are grouped under a single include(). The
+# resolver matches the prefix once and only walks these patterns for requests under API_ROOT.
+api_patterns = [
+    re_path(r"^repair/", RepairView.as_view()),
+    re_path(r"^status/", StatusView.as_view()),
+    re_path(r"^orphans/cleanup/", OrphansCleanupViewset.as_view({"post": "cleanup"})),
+    re_path(r"^orphans/", OrphansView.as_view()),
+    re_path(r"^repository_versions/", ListRepositoryVersionViewSet.as_view({"get": "list"})),
+    re_path(r"^importers/core/pulp/import-check/", PulpImporterImportCheckView.as_view()),
+    re_path(
+        r"^docs/api.json",
         SpectacularJSONAPIView.as_view(authentication_classes=[], permission_classes=[]),
         name="schema",
-    )
-)
-
-urlpatterns.append(
-    url(
-        r"^{api_root}docs/api.yaml".format(api_root=API_ROOT),
+    ),
+    re_path(
+        r"^docs/api.yaml",
         SpectacularYAMLAPIView.as_view(authentication_classes=[], permission_classes=[]),
         name="schema-yaml",
-    )
-)
-
-urlpatterns.append(
-    url(
-        r"^{api_root}docs/".format(api_root=API_ROOT),
+    ),
+    re_path(
+        r"^docs/",
         SpectacularRedocView.as_view(
             authentication_classes=[],
             permission_classes=[],
             url="/pulp/api/v3/docs/api.json?include_html=1",
         ),
         name="schema-redoc",
-    )
-)
+    ),
+]
 
 schema_view = get_schema_view(
     title="Pulp API", permission_classes=[permissions.AllowAny], generator_class=PulpSchemaGenerator
 )
 
-urlpatterns.append(url(r"^{api_root}$".format(api_root=API_ROOT), schema_view))
+api_patterns.append(path("", schema_view))
 
 all_routers = [root_router] + vs_tree.register_with(root_router)
 for router in all_routers:
-    urlpatterns.append(url(r"^{api_root}".format(api_root=API_ROOT), include(router.urls)))
+    api_patterns.append(path("", include(router.urls)))
+
+urlpatterns = [
+    path(API_ROOT, include(api_patterns)),
+    path("auth/", include("rest_framework.urls")),
+    path(settings.ADMIN_SITE_URL, admin.site.urls),
+]
 
 # If plugins define a urls.py, include them into the root namespace.
 for plugin_pattern in plugin_patterns:
-    urlpatterns.append(url(r"", include(plugin_pattern)))
+    urlpatterns.append(path("", include(plugin_pattern)))
@@ -10,6 +10,9 @@ from pulpcore.app import models
 # a little cache so viewset_for_model doesn't have iterate over every app every time
 _model_viewset_cache = {}
 
+# a little cache so view_name_for_model doesn't have to iterate over every router every time
+_viewset_base_name_cache = {}
+
 
 # based on their name, viewset_for_model and view_name_for_model look like they should
 # live over in the viewsets namespace, but these tools exist for serializers, which are
@@ -71,9 +74,13 @@ def get_view_name_for_model(model_obj, view_action):
 
     # return the complete view name, joining the registered viewset base name with
     # the requested view method.
+    if viewset in _viewset_base_name_cache:
+        return "-".join((_viewset_base_name_cache[viewset], view_action))
+
     for router in all_routers:
         for pattern, registered_viewset, base_name in router.registry:
             if registered_viewset is viewset:
+                _viewset_base_name_cache[viewset] = base_name
                 return "-".join((base_name, view_action))
     raise LookupError("view not found")
 
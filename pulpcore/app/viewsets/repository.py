@@ -54,6 +54,16 @@ class BaseRepositoryViewSet(NamedModelViewSet):
     router_lookup = "repository"
     filterset_class = RepositoryFilter
 
+    def get_queryset(self):
+        """
+        Gets a QuerySet of repositories along with the relations their serializer renders.
+
+        The remote and the labels of each repository are fetched with the repositories instead of
+        with one query per repository.
+        """
+        qs = super().get_queryset()
+        return qs.select_related("remote").prefetch_related("pulp_labels")
+
 
 class ListRepositoryViewSet(BaseRepositoryViewSet, mixins.ListModelMixin):
     """Endpoint to list all repositories."""
@@ -258,9 +258,8 @@ class Handler:
                 )
             except ObjectDoesNotExist:
                 log.debug(
-                    _("Distribution not matched for {path} using: {base_paths}").format(
-                        path=path, base_paths=base_paths
-                    )
+                    _("Distribution not matched for %(path)s using: %(base_paths)s"),
+                    {"path": path, "base_paths": base_paths},
                 )
         else:
             try:
@@ -269,9 +268,8 @@ class Handler:
                 ).get(base_path__in=base_paths)
             except ObjectDoesNotExist:
                 log.debug(
-                    _("Distribution not matched for {path} using: {base_paths}").format(
-                        path=path, base_paths=base_paths
-                    )
+                    _("Distribution not matched for %(path)s using: %(base_paths)s"),
+                    {"path": path, "base_paths": base_paths},
                 )
         raise PathNotResolved(path)
 
@@ -2,6 +2,7 @@ from aiohttp import __version__ as aiohttp_version
 import asyncio
 import atexit
 import copy
+from functools import lru_cache
 from gettext import gettext as _
 from multidict import MultiDict
 import platform
@@ -24,9 +25,12 @@ PROTOCOL_MAP = {
 }
 
 
+@lru_cache(maxsize=1)
 def user_agent():
     """
     Produce a User-Agent string to identify Pulp and relevant system info.
+
+    The result is constant for the lifetime of the process, so it is computed only once.
     """
     pulp_version = get_distribution("pulpcore").version
     python = "{} {}.{}.{}-{}{}".format(sys.implementation.name, *sys.version_info)
@@ -35,6 +39,51 @@ def user_agent():
     return f"pulpcore/{pulp_version} ({python}, {system}) (aiohttp {aiohttp_version})"
 
 
+@lru_cache(maxsize=64)
+def _ssl_context(ca_cert, client_cert, client_key, tls_validation):
+    """
+    Build an SSL context from a remote's TLS settings.
+
+    Loading the CA data and the client certificate chain is expensive, and a remote's settings
+    are reused by every factory built for it, so contexts are cached per unique set of settings.
+    This has some tradeoffs:
+
+    * The same ``SSLContext`` object is shared by every factory with the same settings, so it
+      must not be modified by its users.
+    * The PEM encoded client key of a cached entry stays in memory after its remote is changed or
+      deleted, until the entry is evicted by newer ones or the process exits.
+    * Contexts keep the system trust store as it was loaded when they were created. Changes to it
+      only take effect once the process is restarted.
+
+    Args:
+        ca_cert (str): A PEM encoded CA certificate, or None.
+        client_cert (str): A PEM encoded client certificate, or None.
+        client_key (str): A PEM encoded private key for the client certificate, or None.
+        tls_validation (bool): Whether to verify the server's certificate and hostname.
+
+    Returns:
+        :class:`ssl.SSLContext` or None if the default SSL settings apply.
+    """
+    sslcontext = None
+    if ca_cert:
+        sslcontext = ssl.create_default_context(cadata=ca_cert)
+    if client_key and client_cert:
+        if not sslcontext:
+            sslcontext = ssl.create_default_context()
+        # The certificate and the private key are written to a single PEM file, which
+        # load_cert_chain() reads both from when no separate key file is given.
+        with NamedTemporaryFile() as cert_file:
+            cert_file.write(bytes("\n".join((client_cert, client_key)), "utf-8"))
+            cert_file.flush()
+            sslcontext.load_cert_chain(cert_file.name)
+    if not tls_validation:
+        if not sslcontext:
+            sslcontext = ssl.create_default_context()
+        sslcontext.check_hostname = False
+        sslcontext.verify_mode = ssl.CERT_NONE
+    return sslcontext
+
+
 class DownloaderFactory:
     """
     A factory for creating downloader objects that are configured from with remote settings.
@@ -104,24 +153,12 @@ class DownloaderFactory:
         """
         tcp_conn_opts = {"force_close": True}
 
-        sslcontext = None
-        if self._remote.ca_cert:
-            sslcontext = ssl.create_default_context(cadata=self._remote.ca_cert)
-        if self._remote.client_key and self._remote.client_cert:
-            if not sslcontext:
-                sslcontext = ssl.create_default_context()
-            with NamedTemporaryFile() as key_file:
-                key_file.write(bytes(self._remote.client_key, "utf-8"))
-                key_file.flush()
-                with NamedTemporaryFile() as cert_file:
-                    cert_file.write(bytes(self._remote.client_cert, "utf-8"))
-                    cert_file.flush()
-                    sslcontext.load_cert_chain(cert_file.name, key_file.name)
-        if not self._remote.tls_validation:
-            if not sslcontext:
-                sslcontext = ssl.create_default_context()
-            sslcontext.check_hostname = False
-            sslcontext.verify_mode = ssl.CERT_NONE
+        sslcontext = _ssl_context(
+            self._remote.ca_cert,
+            self._remote.client_cert,
+            self._remote.client_key,
+            self._remote.tls_validation,
+        )
         if sslcontext:
             tcp_conn_opts["ssl_context"] = sslcontext
 
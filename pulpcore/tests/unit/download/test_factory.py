@@ -1,6 +1,12 @@
-from django.test import TestCase
+import os
+import shutil
+import ssl
+import subprocess
+from tempfile import TemporaryDirectory
 
-from pulpcore.download.factory import DownloaderFactory, user_agent
+from django.test import SimpleTestCase, TestCase
+
+from pulpcore.download.factory import DownloaderFactory, _ssl_context, user_agent
 from pulpcore.plugin.models import Remote
 
 
@@ -31,3 +37,57 @@ class DownloaderFactoryHeadersTestCase(TestCase):
         factory = DownloaderFactory(remote)
         downloader = factory.build(remote.url)
         self.assertEqual(downloader.session.headers["Connection"], "keep-alive")
+
+
+class SSLContextTestCase(SimpleTestCase):
+    def test_default_settings(self):
+        self.assertIsNone(_ssl_context(None, None, None, True))
+
+    def test_context_reused(self):
+        sslcontext = _ssl_context(None, None, None, False)
+        self.assertEqual(sslcontext.verify_mode, ssl.CERT_NONE)
+        self.assertFalse(sslcontext.check_hostname)
+        self.assertIs(_ssl_context(None, None, None, False), sslcontext)
+
+    def test_client_cert(self):
+        cert, key = self._self_signed_cert()
+        sslcontext = _ssl_context(None, cert, key, True)
+        self.assertEqual(sslcontext.verify_mode, ssl.CERT_REQUIRED)
+        self.assertIs(_ssl_context(None, cert, key, True), sslcontext)
+
+    def test_ca_cert(self):
+        cert, _key = self._self_signed_cert()
+        sslcontext = _ssl_context(cert, None, None, True)
+        subjects = [ca_cert["subject"] for ca_cert in sslcontext.get_ca_certs()]
+        self.assertIn(((("commonName", "pulp-test"),),), subjects)
+        self.assertIs(_ssl_context(cert, None, None, True), sslcontext)
+
+    def _self_signed_cert(self):
+        """Generate a self-signed certificate and its private key as PEM encoded strings."""
+        if not shutil.which("openssl"):
+            self.skipTest("openssl is not available")
+        with TemporaryDirectory() as tmp_dir:
+            cert_path = os.path.join(tmp_dir, "cert.pem")
+            key_path = os.path.join(tmp_dir, "key.pem")
+            subprocess.run(
+                [
+                    "openssl",
+                    "req",
+                    "-x509",
+                    "-newkey",
+                    "rsa:2048",
+                    "-nodes",
+                    "-days",
+                    "1",
+                    "-subj",
+                    "/CN=pulp-test",
+                    "-keyout",
+                    key_path,
+                    "-out",
+                    cert_path,
+                ],
+                check=True,
+                capture_output=True,
+            )
+            with open(cert_path) as cert_file, open(key_path) as key_file:
+                return cert_file.read(), key_file.read()
@@ -231,6 +231,25 @@ class RepositoryVersionTestCase(TestCase):
         with self.assertRaises(StopIteration):
             self.pks_of_next_qs(qs_generator)
 
+    def test_with_content(self):
+        """Verify that with_content() returns the versions a content unit is present in."""
+        with self.repository.new_version() as version1:
+            version1.add_content(self.content_qs(self.pks[:2]))  # v1 == content ids 0-1
+
+        with self.repository.new_version() as version2:
+            version2.remove_content(self.content_qs(self.pks[:1]))  # v2 == content id 1
+
+        with self.repository.new_version() as version3:
+            version3.add_content(self.content_qs(self.pks[:1]))  # v3 == content ids 0-1
+
+        versions = RepositoryVersion.objects.filter(repository=self.repository)
+        self.assertCountEqual(versions.with_content(self.pks[:1]), [version1, version3])
+        self.assertCountEqual(versions.with_content(self.pks[1:2]), [version1, version2, version3])
+        self.assertCountEqual(
+            versions.with_content(self.content_qs(self.pks[:2])), [version1, version2, version3]
+        )
+        self.assertFalse(versions.with_content(self.pks[2:]).exists())
+
 
 class RepositoryTestCase(TestCase):
     def setUp(self):
@@ -9,6 +9,7 @@ from pulpcore.app.serializers import (
     DistributionSerializer,
     PublicationSerializer,
     RemoteSerializer,
+    RepositorySyncURLSerializer,
 )
 
 
@@ -71,6 +72,44 @@ class TestRemoteSerializer(TestCase):
             serializer.is_valid(raise_exception=True)
         self.assertIn("can only be specified together", str(ctx.exception))
 
+    def test_fields_bound_per_instance(self):
+        serializer = RemoteSerializer()
+        other_serializer = RemoteSerializer()
+        self.assertIsNot(serializer.fields["name"], other_serializer.fields["name"])
+        self.assertIs(serializer.fields["name"].parent, serializer)
+        self.assertIs(other_serializer.fields["name"].parent, other_serializer)
+        self.assertIsNot(
+            serializer.fields["headers"].child, other_serializer.fields["headers"].child
+        )
+        self.assertIs(serializer.fields["headers"].child.parent, serializer.fields["headers"])
+
+    def test_field_changes_not_shared(self):
+        class EditingRemoteSerializer(RemoteSerializer):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.fields["url"].validators.append(lambda value: None)
+                self.fields["name"].error_messages["custom"] = "Custom error."
+
+        url_validators = len(RemoteSerializer().fields["url"].validators)
+        EditingRemoteSerializer()
+        serializer = EditingRemoteSerializer()
+        self.assertEqual(len(serializer.fields["url"].validators), url_validators + 1)
+        self.assertEqual(len(RemoteSerializer().fields["url"].validators), url_validators)
+        self.assertNotIn("custom", RemoteSerializer().fields["name"].error_messages)
+
+    def test_context_dependent_fields(self):
+        class ContextRemoteSerializer(RemoteSerializer):
+            def get_field_names(self, declared_fields, info):
+                field_names = super().get_field_names(declared_fields, info)
+                if self.context.get("hide_proxy"):
+                    field_names = [name for name in field_names if not name.startswith("proxy_")]
+                return field_names
+
+        self.assertIn("proxy_url", ContextRemoteSerializer().fields)
+        serializer = ContextRemoteSerializer(context={"hide_proxy": True})
+        self.assertNotIn("proxy_url", serializer.fields)
+        self.assertIn("proxy_url", ContextRemoteSerializer().fields)
+
 
 class TestPublicationSerializer(TestCase):
     @mock.patch("pulpcore.app.serializers.repository.models.Repository")
@@ -117,6 +156,36 @@ class TestPublicationSerializer(TestCase):
             serializer.validate(data)
 
 
+class TestRepositorySyncURLSerializer(TestCase):
+    @mock.patch("pulpcore.app.serializers.repository.models.Repository")
+    def test_validate_remote(self, mock_repo):
+        mock_remote = mock.MagicMock()
+        data = {"remote": mock_remote, "mirror": False}
+        serializer = RepositorySyncURLSerializer(context={"repository_pk": mock_repo.pk})
+        self.assertEqual(serializer.validate(data), data)
+        mock_repo.objects.filter.assert_not_called()
+
+    @mock.patch("pulpcore.app.serializers.repository.models.Repository")
+    def test_validate_repository_remote(self, mock_repo):
+        mock_repo.objects.filter.return_value.exists.return_value = True
+        data = {"mirror": False}
+        serializer = RepositorySyncURLSerializer(context={"repository_pk": mock_repo.pk})
+        self.assertEqual(serializer.validate(data), data)
+        mock_repo.objects.filter.assert_called_once_with(pk=mock_repo.pk, remote__isnull=False)
+
+    @mock.patch("pulpcore.app.serializers.repository.models.Repository")
+    def test_validate_no_remote(self, mock_repo):
+        mock_repo.objects.filter.return_value.exists.return_value = False
+        serializer = RepositorySyncURLSerializer(context={"repository_pk": mock_repo.pk})
+        with self.assertRaises(serializers.ValidationError):
+            serializer.validate({"mirror": False})
+
+    def test_validate_no_remote_no_repository(self):
+        serializer = RepositorySyncURLSerializer()
+        with self.assertRaises(serializers.ValidationError):
+            serializer.validate({"mirror": False})
+
+
 class TestDistributionPath(TestCase):
     def test_overlap(self):
         Distribution.objects.create(base_path="foo/bar", name="foobar")
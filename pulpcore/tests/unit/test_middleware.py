@@ -0,0 +1,21 @@
+from django.test import TestCase
+
+from pulpcore.constants import API_ROOT
+
+
+class APIGZipMiddlewareTestCase(TestCase):
+    def test_json_compressed(self):
+        response = self.client.get(
+            f"/{API_ROOT}status/", HTTP_ACCEPT="application/json", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_html_not_compressed(self):
+        response = self.client.get(
+            f"/{API_ROOT}status/", HTTP_ACCEPT="text/html", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/html"))
+        self.assertNotIn("Content-Encoding", response)
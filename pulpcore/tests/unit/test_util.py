@@ -11,6 +11,15 @@ class TestViewNameForModel(TestCase):
         ret = util.get_view_name_for_model(models.Artifact(), "foo")
         self.assertEqual(ret, "artifacts-foo")
 
+    def test_cached_base_name(self):
+        """
+        Use the cached base name of a viewset for other view actions.
+        """
+        util.get_view_name_for_model(models.Artifact(), "foo")
+        with mock.patch("pulpcore.app.urls.all_routers", []):
+            ret = util.get_view_name_for_model(models.Artifact(), "bar")
+        self.assertEqual(ret, "artifacts-bar")
+
     @mock.patch.object(util, "get_viewset_for_model")
     def test_not_found(self, mock_viewset_for_model):
         """